@@ -2,11 +2,23 @@
 Setup script for StreamChat library.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# The compiled Twitch parser is optional; without Cython (or a compiler)
+# the pure Python implementation is used instead.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension("streamchat._twitch_parse", ["streamchat/_twitch_parse.pyx"], optional=True)],
+        language_level=3,
+    )
+
 setup(
     name="streamchat",
     version="0.1.0",
@@ -17,6 +29,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/jbernardic/streamchat",
     packages=find_packages(),
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -38,6 +51,9 @@ setup(
         "aiohttp>=3.8.0",
         "websockets>=10.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.0", "msgspec>=0.18"],
+    },
     keywords="chat, livestream, youtube, twitch, kick, streaming, realtime",
     project_urls={
         "Bug Reports": "https://github.com/jbernardic/streamchat/issues",
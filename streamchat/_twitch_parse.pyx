@@ -0,0 +1,126 @@
+# cython: language_level=3
+"""
+Compiled parser for Twitch IRC PRIVMSG lines.
+
+Mirrors TwitchChatClient._parse_privmsg, which is used when this
+extension is not built.
+"""
+
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport memchr, memcmp
+from sys import intern
+
+
+cdef const char* _PRIVMSG = b" PRIVMSG #"
+cdef Py_ssize_t _PRIVMSG_LEN = 10
+
+
+cdef inline str _decode(const char* buf, Py_ssize_t start, Py_ssize_t end):
+    return PyUnicode_DecodeUTF8(buf + start, end - start, "replace")
+
+
+cdef inline Py_ssize_t _find_char(const char* buf, Py_ssize_t start, Py_ssize_t end, char c):
+    if start >= end:
+        return -1
+    cdef const char* hit = <const char*>memchr(buf + start, c, end - start)
+    return -1 if hit == NULL else hit - buf
+
+
+cdef Py_ssize_t _find(const char* buf, Py_ssize_t start, Py_ssize_t end,
+                      const char* needle, Py_ssize_t needle_len):
+    cdef Py_ssize_t last = end - needle_len
+    cdef Py_ssize_t pos = start
+    while pos <= last:
+        pos = _find_char(buf, pos, last + 1, needle[0])
+        if pos == -1:
+            return -1
+        if memcmp(buf + pos, needle, needle_len) == 0:
+            return pos
+        pos += 1
+    return -1
+
+
+cdef dict _parse_tags(const char* buf, Py_ssize_t start, Py_ssize_t end):
+    cdef dict tags = {}
+    cdef Py_ssize_t tag_end, eq
+    while start < end:
+        tag_end = _find_char(buf, start, end, b";")
+        if tag_end == -1:
+            tag_end = end
+        eq = _find_char(buf, start, tag_end, b"=")
+        if eq != -1:
+            tags[_decode(buf, start, eq)] = _decode(buf, eq + 1, tag_end)
+        start = tag_end + 1
+    return tags
+
+
+cdef list _extract_badges(dict tags):
+    cdef list badges = []
+    cdef str badge_info = tags.get("badges", "")
+    cdef str badge
+    if badge_info:
+        for badge in badge_info.split(","):
+            if "/" in badge:
+                badges.append(intern(badge.split("/")[0]))
+    return badges
+
+
+cdef list _extract_emotes(dict tags):
+    cdef list emotes = []
+    cdef str emote_info = tags.get("emotes", "")
+    cdef str emote_group, emote_id, positions, position, start, end
+    if emote_info:
+        for emote_group in emote_info.split("/"):
+            if ":" in emote_group:
+                emote_id, positions = emote_group.split(":", 1)
+                for position in positions.split(","):
+                    if "-" in position:
+                        start, end = position.split("-")
+                        emotes.append((emote_id, int(start), int(end)))
+    return emotes
+
+
+cpdef tuple parse_privmsg(bytes line):
+    """
+    Split a raw PRIVMSG line into its parts.
+
+    Returns:
+        (tags, username, channel, content, badges, emotes), or None if the
+        line is not a PRIVMSG. The channel is left undecoded (bytes).
+    """
+    cdef const char* buf = line
+    cdef Py_ssize_t length = len(line)
+    cdef Py_ssize_t pos = 0
+    cdef Py_ssize_t space, bang, command, channel_start, content_start
+    cdef dict tags = {}
+
+    # Handle messages with tags (user info)
+    if length and buf[0] == b"@":
+        space = _find_char(buf, 1, length, b" ")
+        if space == -1:
+            return None
+        tags = _parse_tags(buf, 1, space)
+        pos = space + 1
+
+    # :username!username@username.tmi.twitch.tv PRIVMSG #channel :message
+    if pos >= length or buf[pos] != b":":
+        return None
+    bang = _find_char(buf, pos + 1, length, b"!")
+    if bang == -1:
+        return None
+    command = _find(buf, bang, length, _PRIVMSG, _PRIVMSG_LEN)
+    if command == -1:
+        return None
+    channel_start = command + _PRIVMSG_LEN
+    content_start = _find(buf, channel_start, length, b" :", 2)
+    if content_start == -1 or content_start + 2 == length:
+        return None
+
+    return (
+        tags,
+        _decode(buf, pos + 1, bang),
+        line[channel_start:content_start],
+        _decode(buf, content_start + 2, length),
+        _extract_badges(tags),
+        _extract_emotes(tags),
+    )
@@ -2,13 +2,17 @@
 Abstract base class for chat clients.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, Any, Optional, List
+from typing import AsyncGenerator, Dict, Any, Optional, List, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+# Slotted messages drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatMessage:
     """Represents a chat message from any platform."""
     id: str
@@ -17,8 +21,8 @@ class ChatMessage:
     timestamp: datetime
     platform: str
     author_id: Optional[str] = None
-    badges: Optional[List[str]] = None
-    emotes: Optional[List[Dict[str, Any]]] = None
+    badges: Optional[Sequence[str]] = None
+    emotes: Optional[List[Tuple[str, int, int]]] = None  # (emote_id, start, end)
     color: Optional[str] = None
     is_moderator: bool = False
     is_subscriber: bool = False
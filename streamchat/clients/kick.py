@@ -4,14 +4,83 @@ Kick chat client implementation using WebSocket and Pusher protocol.
 
 import asyncio
 import json
-from typing import AsyncGenerator, Optional, Dict, Any, List
+import sys
+from typing import AsyncGenerator, Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import aiohttp
-import cloudscraper
 import websockets
 from ..base import BaseChatClient, ChatMessage
 from ..exceptions import StreamChatError, ConnectionError, StreamNotFoundError
-import ua_generator
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+_WS_BUFFER_SIZE = 64 * 1024
+
+# Pusher control messages, pre-serialized (sent as text frames, hence str)
+_PONG_MESSAGE = '{"event":"pusher:pong","data":{}}'
+_SUBSCRIBE_TEMPLATE = '{{"event":"pusher:subscribe","data":{{"channel":"chatrooms.{}.v2","auth":""}}}}'
+
+_API_HEADERS = {
+    "Accept": "application/json",
+    "Alt-Used": "kick.com",
+    "Priority": "u=0, i",
+    "Connection": "keep-alive",
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+    ),
+}
+
+# Chatroom IDs are stable per channel, so reconnects can skip the API lookup
+_CHATROOM_ID_CACHE: Dict[str, int] = {}
+
+# HTTP session shared by the Kick clients of one event loop so its connection
+# pool is reused; closed once the last of those clients disconnects
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_session_users = 0
+
+
+def _as_str(value: Any) -> str:
+    """Convert a value to str, reusing it when it already is one."""
+    return value if type(value) is str else str(value)
+
+
+def _acquire_session() -> aiohttp.ClientSession:
+    """
+    Return the shared HTTP session for the running event loop.
+    
+    A new session is created on first use, after it was closed, or when the
+    running loop differs from the one it was created on (e.g. a later
+    asyncio.run() call), since aiohttp sessions are bound to their loop.
+    """
+    global _shared_session, _shared_session_loop, _shared_session_users
+    loop = asyncio.get_running_loop()
+    if (_shared_session is None or _shared_session.closed
+            or _shared_session_loop is not loop):
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300)
+        )
+        _shared_session_loop = loop
+        _shared_session_users = 0
+    _shared_session_users += 1
+    return _shared_session
+
+
+async def _release_session(session: aiohttp.ClientSession) -> None:
+    """Drop one user of the shared session, closing it when none remain."""
+    global _shared_session, _shared_session_loop, _shared_session_users
+    if session is not _shared_session:
+        return
+    _shared_session_users -= 1
+    if _shared_session_users <= 0:
+        _shared_session = None
+        _shared_session_loop = None
+        _shared_session_users = 0
+        await session.close()
 
 
 class KickChatClient(BaseChatClient):
@@ -39,23 +108,18 @@ class KickChatClient(BaseChatClient):
         
     async def connect(self) -> None:
         """Connect to Kick chat WebSocket."""
-
-        self.ua = ua_generator.generate()
-        self.headers = {
-            "Accept": "application/json",
-            "Alt-Used": "kick.com",
-            "Priority": "u=0, i",
-            "Connection": "keep-alive",
-            "User-Agent": self.ua.text
-        }
-
-        self.session = cloudscraper.CloudScraper()
+        if self.session is None:
+            self.session = _acquire_session()
         
-        # Get chat room ID
-        self._get_chat_room_id()
-        
-        # Connect to WebSocket
-        await self._connect_websocket()
+        try:
+            # Get chat room ID
+            await self._get_chat_room_id()
+            
+            # Connect to WebSocket
+            await self._connect_websocket()
+        except BaseException:
+            await self._release_session()
+            raise
         
         self.is_connected = True
         
@@ -64,27 +128,48 @@ class KickChatClient(BaseChatClient):
         if self.websocket:
             await self.websocket.close()
             
-        if self.session:
-            self.session.close()
-            
+        await self._release_session()
         self.is_connected = False
         
-    def _get_chat_room_id(self) -> None:
+    async def _release_session(self) -> None:
+        """Stop using the shared HTTP session."""
+        if self.session is not None:
+            session, self.session = self.session, None
+            await _release_session(session)
+        
+    @staticmethod
+    async def shutdown_shared_session() -> None:
+        """Close the HTTP session shared by all Kick clients."""
+        global _shared_session, _shared_session_loop, _shared_session_users
+        if _shared_session is not None:
+            session = _shared_session
+            _shared_session = None
+            _shared_session_loop = None
+            _shared_session_users = 0
+            await session.close()
+        
+    async def _get_chat_room_id(self) -> None:
         """Get the chat room ID for the channel."""
+        if self.channel in _CHATROOM_ID_CACHE:
+            self.chat_room_id = _CHATROOM_ID_CACHE[self.channel]
+            return
+            
         url = f"https://kick.com/api/v1/channels/{self.channel}"
         try:
-            with self.session.get(url, headers=self.headers) as response:
-                if response.status_code == 404:
+            async with self.session.get(url, headers=_API_HEADERS) as response:
+                if response.status == 404:
                     raise StreamNotFoundError(f"Channel not found: {self.channel}")
-                elif response.status_code != 200:
-                    raise StreamChatError(f"Failed to get channel info: {response.status_code}")
+                elif response.status != 200:
+                    raise StreamChatError(f"Failed to get channel info: {response.status}")
                     
-                data = response.json()
+                data = await response.json(content_type=None)
                 self.chat_room_id = data.get('chatroom', {}).get('id')
                 
                 if not self.chat_room_id:
                     raise StreamChatError("No chat room found for this channel")
                     
+                _CHATROOM_ID_CACHE[self.channel] = self.chat_room_id
+                    
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Kick API: {e}")
             
@@ -97,17 +182,17 @@ class KickChatClient(BaseChatClient):
 
         
         try:
-            self.websocket = await websockets.connect(websocket_url)
-            
-            subscribe_data = {
-                "event": "pusher:subscribe",
-                "data": {
-                    "channel": f"chatrooms.{self.chat_room_id}.v2",
-                    "auth": ""
-                }
-            }
+            # Chat frames are small, so keep per-connection buffers tight and
+            # skip permessage-deflate; Pusher handles keepalive via pusher:ping
+            self.websocket = await websockets.connect(
+                websocket_url,
+                max_size=_WS_BUFFER_SIZE,
+                write_limit=_WS_BUFFER_SIZE,
+                compression=None,
+                ping_interval=None,
+            )
             
-            await self.websocket.send(json.dumps(subscribe_data))
+            await self.websocket.send(_SUBSCRIBE_TEMPLATE.format(self.chat_room_id))
             
         except Exception as e:
             raise ConnectionError(f"Failed to connect to Kick WebSocket: {e}")
@@ -120,18 +205,20 @@ class KickChatClient(BaseChatClient):
         try:
             async for message in self.websocket:
                 try:
-                    # Parse the outer event structure first
-                    event_data = json.loads(message)
-
-                    # Handle ping/pong
-                    if event_data.get('event') == 'pusher:ping':
-                        await self._send_pong()
+                    # Skip control and other non-chat frames without a full parse
+                    if 'ChatMessageEvent' not in message:
+                        # Handle ping/pong
+                        if 'pusher:ping' in message and _json_loads(message).get('event') == 'pusher:ping':
+                            await self._send_pong()
                         continue
                     
+                    # Parse the outer event structure
+                    event_data = _json_loads(message)
+                    
                     # Check if this is a chat message event
                     if event_data.get('event') and 'ChatMessageEvent' in event_data.get('event', ''):
                         # Parse the inner message data (like Go implementation)
-                        inner_data = json.loads(event_data.get('data', '{}'))
+                        inner_data = _json_loads(event_data.get('data', '{}'))
                         chat_message = self._parse_chat_message(inner_data)
                         if chat_message:
                             yield chat_message
@@ -163,60 +250,52 @@ class KickChatClient(BaseChatClient):
             if not user or not content:
                 return None
                 
+            badges, is_moderator, is_subscriber = self._extract_badge_info(user)
+            
             return ChatMessage(
-                id=str(message_data.get('id', '')),
+                id=_as_str(message_data.get('id', '')),
                 author=user.get('username', 'Unknown'),
                 content=content,
                 timestamp=datetime.now(),  # Kick doesn't provide precise timestamps
                 platform='kick',
-                author_id=str(user.get('id', '')),
-                badges=self._extract_badges(user),
+                author_id=_as_str(user.get('id', '')),
+                badges=badges,
                 color=user.get('identity', {}).get('color'),
-                is_moderator=self._is_moderator(user),
-                is_subscriber=self._is_subscriber(user),
+                is_moderator=is_moderator,
+                is_subscriber=is_subscriber,
                 raw_data=message_data
             )
             
         except KeyError:
             return None
             
-    def _extract_badges(self, user: Dict[str, Any]) -> List[str]:
-        """Extract user badges."""
+    def _extract_badge_info(self, user: Dict[str, Any]) -> Tuple[List[str], bool, bool]:
+        """Extract user badges along with moderator and subscriber flags."""
         badges = []
+        is_moderator = is_subscriber = False
         identity = user.get('identity', {})
         
         # Extract badges from identity.badges like Go reference
-        badge_list = identity.get('badges', [])
-        for badge in badge_list:
-            if isinstance(badge, dict):
-                badge_type = badge.get('type', '')
-                if badge_type:
-                    badges.append(badge_type)
+        for badge in identity.get('badges', ()):
+            badge_type = badge.get('type') if isinstance(badge, dict) else None
+            if not badge_type:
+                continue
+            badges.append(sys.intern(badge_type))
+            if badge_type == 'moderator':
+                is_moderator = True
+            elif badge_type == 'subscriber':
+                is_subscriber = True
         
         # Add color badge if present
         if identity.get('color'):
             badges.append('colored_name')
             
-        return badges
-        
-    def _is_moderator(self, user: Dict[str, Any]) -> bool:
-        """Check if user is a moderator."""
-        badges = self._extract_badges(user)
-        return "moderator" in badges
-        
-    def _is_subscriber(self, user: Dict[str, Any]) -> bool:
-        """Check if user is a subscriber."""
-        badges = self._extract_badges(user)
-        return "subscriber" in badges
+        return badges, is_moderator, is_subscriber
         
     async def _send_pong(self) -> None:
         """Send pong response to ping."""
         if self.websocket:
-            pong_data = {
-                "event": "pusher:pong",
-                "data": {}
-            }
-            await self.websocket.send(json.dumps(pong_data))
+            await self.websocket.send(_PONG_MESSAGE)
             
     def get_platform_name(self) -> str:
         """Return the platform name."""
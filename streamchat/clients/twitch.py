@@ -3,12 +3,24 @@ Twitch chat client implementation using IRC protocol.
 """
 
 import asyncio
-import re
-from typing import AsyncGenerator, Optional, Dict, Any, List
+import sys
+from typing import AsyncGenerator, Optional, Dict, List, Tuple
 from datetime import datetime
 from ..base import BaseChatClient, ChatMessage
 from ..exceptions import StreamChatError, AuthenticationError, ConnectionError
 
+try:
+    from .._twitch_parse import parse_privmsg as _parse_privmsg
+except ImportError:
+    _parse_privmsg = None
+
+_PRIVMSG = b' PRIVMSG #'
+_READ_BUFFER_SIZE = 64 * 1024
+_READ_CHUNK_SIZE = 8192
+
+# (tags, username, channel, content, badges, emotes)
+_ParsedPrivmsg = Tuple[Dict[str, str], str, bytes, str, List[str], List[Tuple[str, int, int]]]
+
 
 class TwitchChatClient(BaseChatClient):
     """Twitch chat client using IRC protocol."""
@@ -26,6 +38,7 @@ class TwitchChatClient(BaseChatClient):
         super().__init__(stream_id, **kwargs)
         self.oauth_token = oauth_token
         self.channel = self._extract_channel_name(self.stream_id)
+        self._channel_bytes = self.channel.encode('utf-8')
         self.username = kwargs.get('username') or 'justinfan12345'  # Anonymous user
         self.reader: Optional[asyncio.StreamReader] = None
         self.writer: Optional[asyncio.StreamWriter] = None
@@ -42,7 +55,7 @@ class TwitchChatClient(BaseChatClient):
         """Connect to Twitch IRC chat."""
         try:
             self.reader, self.writer = await asyncio.open_connection(
-                self.host, self.port
+                self.host, self.port, limit=_READ_BUFFER_SIZE
             )
             
             # Send authentication
@@ -83,70 +96,123 @@ class TwitchChatClient(BaseChatClient):
         if not self.is_connected:
             raise StreamChatError("Not connected to chat stream")
             
+        # Read in chunks and split lines locally so a burst of buffered
+        # lines costs one await instead of one per line
+        pending = b''
         while self.is_connected:
             try:
-                line = await self.reader.readline()
-                if not line:
+                chunk = await self.reader.read(_READ_CHUNK_SIZE)
+                if not chunk:
                     break
                     
-                line = line.decode('utf-8').strip()
+                lines = (pending + chunk).split(b'\r\n')
+                pending = lines.pop()
                 
-                # Handle PING/PONG
-                if line.startswith('PING'):
-                    await self._send_command('PONG :tmi.twitch.tv')
-                    continue
+                for line in lines:
+                    line = line.strip()
                     
-                # Parse message
-                message = self._parse_message(line)
-                if message:
-                    yield message
+                    # Handle PING/PONG
+                    if line.startswith(b'PING'):
+                        await self._send_command('PONG :tmi.twitch.tv')
+                        continue
+                        
+                    # Parse message
+                    message = self._parse_message(line)
+                    if message:
+                        yield message
                     
             except Exception as e:
                 raise StreamChatError(f"Error reading from IRC: {e}")
                 
-    def _parse_message(self, line: str) -> Optional[ChatMessage]:
+    def _parse_message(self, line: bytes) -> Optional[ChatMessage]:
         """Parse IRC message into ChatMessage."""
-        # Handle messages with tags (user info)
-        tags = {}
-        if line.startswith('@'):
-            tag_part, line = line[1:].split(' ', 1)
-            tags = self._parse_tags(tag_part)
+        if _parse_privmsg is not None:
+            parsed = _parse_privmsg(line)
+        else:
+            parsed = self._parse_privmsg(line)
             
-        # Parse IRC message format
-        # :username!username@username.tmi.twitch.tv PRIVMSG #channel :message
-        pattern = r'^:(\w+)!\w+@\w+\.tmi\.twitch\.tv PRIVMSG #(\w+) :(.+)$'
-        match = re.match(pattern, line)
-        
-        if not match:
+        if parsed is None:
             return None
             
-        username, channel, content = match.groups()
+        tags, username, channel, content, badges, emotes = parsed
         
-        if channel != self.channel:
+        if channel != self._channel_bytes:
             return None
             
+        # Prefer the server-side send time over reading the local clock
+        sent_ts = tags.get('tmi-sent-ts')
+        if sent_ts and sent_ts.isdigit():
+            timestamp = datetime.fromtimestamp(int(sent_ts) / 1000)
+        else:
+            timestamp = datetime.now()
+            
+        # raw_line holds the IRC line without its tag section, as text
+        if line[:1] == b'@':
+            line = line[line.find(b' ') + 1:]
+            
         return ChatMessage(
-            id=tags.get('id', f"{username}_{datetime.now().timestamp()}"),
+            id=tags.get('id') or f"{username}_{timestamp.timestamp()}",
             author=tags.get('display-name', username),
             content=content,
-            timestamp=datetime.now(),
+            timestamp=timestamp,
             platform='twitch',
             author_id=tags.get('user-id'),
-            badges=self._extract_badges(tags),
-            emotes=self._extract_emotes(tags),
+            badges=badges,
+            emotes=emotes,
             color=tags.get('color'),
             is_moderator=tags.get('mod') == '1',
             is_subscriber=tags.get('subscriber') == '1',
             is_vip=tags.get('vip') == '1',
-            raw_data={'tags': tags, 'raw_line': line}
+            raw_data={'tags': tags, 'raw_line': line.decode('utf-8', 'replace')}
         )
         
+    def _parse_privmsg(self, line: bytes) -> Optional[_ParsedPrivmsg]:
+        """
+        Split a raw PRIVMSG line into its parts.
+        
+        Pure Python counterpart of the compiled streamchat._twitch_parse
+        module, used when the extension is not built.
+        
+        Returns:
+            The parsed parts (channel left undecoded), or None if the line
+            is not a PRIVMSG
+        """
+        # Handle messages with tags (user info)
+        tags = {}
+        if line.startswith(b'@'):
+            space = line.find(b' ')
+            if space == -1:
+                return None
+            tags = self._parse_tags(line[1:space].decode('utf-8', 'replace'))
+            line = line[space + 1:]
+            
+        # Parse IRC message format
+        # :username!username@username.tmi.twitch.tv PRIVMSG #channel :message
+        if not line.startswith(b':'):
+            return None
+        bang = line.find(b'!', 1)
+        if bang == -1:
+            return None
+        command = line.find(_PRIVMSG, bang)
+        if command == -1:
+            return None
+        channel_start = command + len(_PRIVMSG)
+        content_start = line.find(b' :', channel_start)
+        if content_start == -1 or content_start + 2 == len(line):
+            return None
+            
+        username = line[1:bang].decode('utf-8', 'replace')
+        channel = line[channel_start:content_start]
+        content = line[content_start + 2:].decode('utf-8', 'replace')
+        
+        return tags, username, channel, content, self._extract_badges(tags), self._extract_emotes(tags)
+        
     def _parse_tags(self, tag_string: str) -> Dict[str, str]:
         """Parse IRC tags into dictionary."""
         tags = {}
         for tag in tag_string.split(';'):
-            if '=' in tag:
-                key, value = tag.split('=', 1)
+            key, sep, value = tag.partition('=')
+            if sep:
                 tags[key] = value
         return tags
         
@@ -159,12 +225,12 @@ class TwitchChatClient(BaseChatClient):
             for badge in badge_info.split(','):
                 if '/' in badge:
                     badge_name = badge.split('/')[0]
-                    badges.append(badge_name)
+                    badges.append(sys.intern(badge_name))
                     
         return badges
         
-    def _extract_emotes(self, tags: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Extract emote information from tags."""
+    def _extract_emotes(self, tags: Dict[str, str]) -> List[Tuple[str, int, int]]:
+        """Extract emote positions from tags as (emote_id, start, end) tuples."""
         emotes = []
         emote_info = tags.get('emotes', '')
         
@@ -176,11 +242,7 @@ class TwitchChatClient(BaseChatClient):
                     for position in positions.split(','):
                         if '-' in position:
                             start, end = position.split('-')
-                            emotes.append({
-                                'id': emote_id,
-                                'start': int(start),
-                                'end': int(end)
-                            })
+                            emotes.append((emote_id, int(start), int(end)))
                             
         return emotes
         
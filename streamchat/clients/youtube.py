@@ -3,14 +3,134 @@ YouTube chat client implementation.
 """
 
 import asyncio
-import json
 import re
-from typing import AsyncGenerator, Optional, Dict, Any
-from datetime import datetime
+import time
+from typing import AsyncGenerator, Optional, Dict, Any, Iterator, List, Tuple
+from datetime import datetime, timedelta, timezone
 import aiohttp
 from ..base import BaseChatClient, ChatMessage
 from ..exceptions import StreamChatError, AuthenticationError, StreamNotFoundError
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    # Typed view of the liveChatMessages.list fields we read, so pages decode
+    # straight into structs. Everything is optional: a malformed item is
+    # skipped on its own instead of failing the whole page.
+    class _LiveChatAuthor(msgspec.Struct):
+        displayName: Optional[str] = None
+        channelId: Optional[str] = None
+        isChatOwner: bool = False
+        isChatModerator: bool = False
+        isChatSponsor: bool = False
+        isVerified: bool = False
+
+    class _LiveChatSnippet(msgspec.Struct):
+        type: Optional[str] = None
+        displayMessage: Optional[str] = None
+        publishedAt: Optional[str] = None
+
+    class _LiveChatItem(msgspec.Struct):
+        id: Optional[str] = None
+        snippet: Optional[_LiveChatSnippet] = None
+        authorDetails: Optional[_LiveChatAuthor] = None
+
+    class _LiveChatPage(msgspec.Struct):
+        items: List[_LiveChatItem] = []
+        nextPageToken: Optional[str] = None
+        pollingIntervalMillis: int = 2000
+
+    _decode_live_chat_page = msgspec.json.Decoder(_LiveChatPage).decode
+    # msgspec.DecodeError is not guaranteed to subclass ValueError
+    _DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+else:
+    _decode_live_chat_page = None
+    _DECODE_ERRORS = (ValueError,)
+
+# Covers watch?v=ID, youtu.be/ID and embed/ID forms
+_VIDEO_ID_RE = re.compile(r'(?:v=|/)([0-9A-Za-z_-]{11})')
+_CHANNEL_URL_RE = re.compile(r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/(?:@([a-zA-Z0-9._-]+)|channel\/(UC[a-zA-Z0-9_-]{22}))')
+
+# Partial response for liveChatMessages.list, trimmed to the fields we parse
+_LIVE_CHAT_FIELDS = (
+    'items(id,snippet(type,displayMessage,publishedAt),'
+    'authorDetails(displayName,channelId,isChatModerator,isChatSponsor,isChatOwner,isVerified)),'
+    'nextPageToken,pollingIntervalMillis'
+)
+
+# Shared badge tuples indexed by an (owner, moderator, member, verified) bitmask
+_BADGE_NAMES = ('owner', 'moderator', 'member', 'verified')
+_BADGE_TABLE = tuple(
+    tuple(name for bit, name in enumerate(_BADGE_NAMES) if mask & (8 >> bit))
+    for mask in range(16)
+)
+
+# Resolution caches shared by all clients: key -> (monotonic expiry, value)
+_CACHE_MAXSIZE = 1024
+_HANDLE_TTL = 24 * 60 * 60  # handles rarely move between channels
+_CHANNEL_LIVE_TTL = 60  # the most watched live stream can change
+_HANDLE_CACHE: Dict[str, Tuple[float, str]] = {}
+_CHANNEL_LIVE_CACHE: Dict[str, Tuple[float, Tuple[str, Optional[str]]]] = {}
+
+# Local UTC offset per 10 minutes of UTC time ('YYYY-MM-DDTHH:M'), for
+# message timestamps
+_LOCAL_OFFSETS: Dict[str, timedelta] = {}
+
+# Last (ETag, payload) per API request, for If-None-Match revalidation
+_ETAG_CACHE: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Tuple[str, Any]] = {}
+
+
+def _cache_get(cache: Dict[str, Tuple[float, Any]], key: str) -> Any:
+    """Return a cached value, or None if it is missing or expired."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del cache[key]
+        return None
+    return entry[1]
+
+
+def _cache_put(cache: Dict[str, Tuple[float, Any]], key: str, value: Any, ttl: float) -> None:
+    """Store a value for ttl seconds, evicting the oldest entry when full."""
+    if key not in cache and len(cache) >= _CACHE_MAXSIZE:
+        del cache[next(iter(cache))]
+    cache[key] = (time.monotonic() + ttl, value)
+
+
+def _parse_published_at(value: str) -> datetime:
+    """
+    Convert a YouTube publishedAt timestamp to a naive local datetime.
+    
+    YouTube sends RFC 3339 timestamps in UTC, so the offset suffix is
+    dropped and the naive UTC time shifted by the local UTC offset, which
+    is looked up once per 10 minutes of timestamps instead of through
+    astimezone() for every message. Hourly lookups would not do: zones with
+    half-hour offsets change DST on the half hour in UTC.
+    """
+    if value.endswith('Z'):
+        utc = datetime.fromisoformat(value[:-1])
+    elif value.endswith('+00:00'):
+        utc = datetime.fromisoformat(value[:-6])
+    else:
+        return datetime.fromisoformat(value).astimezone().replace(tzinfo=None)
+        
+    bucket = value[:15]
+    offset = _LOCAL_OFFSETS.get(bucket)
+    if offset is None:
+        if len(_LOCAL_OFFSETS) >= _CACHE_MAXSIZE:
+            _LOCAL_OFFSETS.clear()
+        offset = _LOCAL_OFFSETS[bucket] = utc.replace(tzinfo=timezone.utc).astimezone().utcoffset()
+    return utc + offset
+
 
 class YouTubeChatClient(BaseChatClient):
     """YouTube chat client using YouTube Data API and live chat polling."""
@@ -32,32 +152,80 @@ class YouTubeChatClient(BaseChatClient):
         self.chat_id: Optional[str] = None
         self.next_page_token: Optional[str] = None
         self.poll_interval = kwargs.get('poll_interval', 2)  # seconds
+        self.keep_raw = kwargs.get('keep_raw', False)  # attach API items as raw_data
+        
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating it on first use."""
+        # One pooled keep-alive session serves every API call, so polling
+        # reuses the TLS connection to googleapis.com
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=10,
+                limit_per_host=10,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        return self.session
+        
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        """
+        GET a Data API resource, revalidating a previous response by ETag.
+        
+        Returns:
+            Tuple of (status, parsed JSON or None); a 304 Not Modified is
+            reported as 200 with the previously fetched payload
+        """
+        cache_key = (url, tuple(sorted((k, str(v)) for k, v in params.items() if k != 'key')))
+        cached = _ETAG_CACHE.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        async with self.session.get(url, params=params, headers=headers) as response:
+            if response.status == 304 and cached:
+                return 200, cached[1]
+            if response.status != 200:
+                return response.status, None
+                
+            data = _json_loads(await response.read())
+            
+            etag = response.headers.get('ETag')
+            if etag:
+                if cache_key not in _ETAG_CACHE and len(_ETAG_CACHE) >= _CACHE_MAXSIZE:
+                    del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+                _ETAG_CACHE[cache_key] = (etag, data)
+                
+            return 200, data
+        
+    async def _get_video_id(self) -> Tuple[str, Optional[str]]:
+        """
+        Extract video ID from YouTube URL.
         
-    async def _get_video_id(self) -> Optional[str]:
-        """Extract video ID from YouTube URL"""
+        Returns:
+            Tuple of (video_id, live chat ID if it was already looked up)
+        """
         # Extract video ID from URL
-        patterns = [
-            r'(?:v=|\/)([0-9A-Za-z_-]{11}).*',
-            r'(?:embed\/)([0-9A-Za-z_-]{11})',
-            r'(?:watch\?v=)([0-9A-Za-z_-]{11})'
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.stream_id)
-            if match:
-                return match.group(1)
+        match = _VIDEO_ID_RE.search(self.stream_id)
+        if match:
+            return match.group(1), None
         
         # If no video ID found, this might be a channel URL
         channel_id = await self._get_channel_id(self.stream_id)
         if not channel_id:
             raise StreamNotFoundError("No video ID or channel ID found")
         
-        return await self._get_video_id_from_channel(channel_id)
-        
-    async def _get_video_id_from_channel(self, channel_id: str) -> Optional[str]:
-        """Gets live video ID with most viewers from a channel."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        cached = _cache_get(_CHANNEL_LIVE_CACHE, channel_id)
+        if cached is not None:
+            return cached
             
+        result = await self._get_video_id_from_channel(channel_id)
+        _cache_put(_CHANNEL_LIVE_CACHE, channel_id, result, _CHANNEL_LIVE_TTL)
+        return result
+        
+    async def _get_video_id_from_channel(self, channel_id: str) -> Tuple[str, Optional[str]]:
+        """Gets live video ID with most viewers from a channel, along with its live chat ID."""
         # Search for live streams from the channel
         url = "https://www.googleapis.com/youtube/v3/search"
         params = {
@@ -71,59 +239,57 @@ class YouTubeChatClient(BaseChatClient):
         }
         
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 401:
-                    raise AuthenticationError("Invalid YouTube API key")
-                elif response.status != 200:
-                    raise StreamChatError(f"Failed to search for live videos: {response.status}")
-                    
-                data = await response.json()
-                
-                if not data.get('items'):
-                    raise StreamNotFoundError(f"No live streams found for channel: {channel_id}")
+            status, data = await self._get_json(url, params)
+            if status == 401:
+                raise AuthenticationError("Invalid YouTube API key")
+            elif status != 200:
+                raise StreamChatError(f"Failed to search for live videos: {status}")
                 
-                # Get video IDs to fetch detailed statistics
-                video_ids = [item['id']['videoId'] for item in data['items']]
-
-                if len(video_ids) == 1:
-                    return video_ids[0]
+            if not data.get('items'):
+                raise StreamNotFoundError(f"No live streams found for channel: {channel_id}")
+            
+            # Get video IDs to fetch detailed statistics
+            video_ids = [item['id']['videoId'] for item in data['items']]
+            
+            # Get live details including concurrent viewer count; this
+            # also carries the live chat ID, so connect() can skip its
+            # own videos.list lookup
+            stats_url = "https://www.googleapis.com/youtube/v3/videos"
+            stats_params = {
+                'part': 'liveStreamingDetails,statistics',
+                'id': ','.join(video_ids),
+                'key': self.api_key
+            }
+            
+            status, stats_data = await self._get_json(stats_url, stats_params)
+            if status != 200:
+                # Fallback to first live video if we can't get stats
+                return video_ids[0], None
                 
-                # Get video statistics including concurrent viewer count
-                stats_url = "https://www.googleapis.com/youtube/v3/videos"
-                stats_params = {
-                    'part': 'liveStreamingDetails,statistics',
-                    'id': ','.join(video_ids),
-                    'key': self.api_key
-                }
+            best_video = None
+            max_viewers = -1
+            
+            for video in stats_data.get('items', []):
+                live_details = video.get('liveStreamingDetails', {})
+                concurrent_viewers = int(live_details.get('concurrentViewers', 0))
                 
-                async with self.session.get(stats_url, params=stats_params) as stats_response:
-                    if stats_response.status != 200:
-                        # Fallback to first live video if we can't get stats
-                        return video_ids[0]
-                    
-                    stats_data = await stats_response.json()
-                    
-                    best_video = None
-                    max_viewers = 0
-                    
-                    for video in stats_data.get('items', []):
-                        live_details = video.get('liveStreamingDetails', {})
-                        concurrent_viewers = int(live_details.get('concurrentViewers', 0))
-                        
-                        if concurrent_viewers > max_viewers:
-                            max_viewers = concurrent_viewers
-                            best_video = video['id']
-                    
-                    # Return the video with most viewers, or first one if no viewer data
-                    return best_video or video_ids[0]
+                if concurrent_viewers > max_viewers:
+                    max_viewers = concurrent_viewers
+                    best_video = video
+            
+            if best_video is None:
+                return video_ids[0], None
                 
+            # Return the video with most viewers, or first one if no viewer data
+            live_details = best_video.get('liveStreamingDetails', {})
+            return best_video['id'], live_details.get('activeLiveChatId')
+            
         except Exception as e:
             raise StreamChatError(f"Error getting livestream with most viewers from channel: {e}")
 
     async def _get_channel_id(self, stream_id):
         """Extract channel ID from YouTube URL or resolve handle to channel ID."""
-        pattern = re.compile(r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/(?:@([a-zA-Z0-9._-]+)|channel\/(UC[a-zA-Z0-9_-]{22}))')
-        match = pattern.match(stream_id)
+        match = _CHANNEL_URL_RE.match(stream_id)
         
         if not match:
             return None
@@ -144,8 +310,9 @@ class YouTubeChatClient(BaseChatClient):
         if not self.api_key:
             raise AuthenticationError("YouTube API key is required to resolve handles")
             
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        cached = _cache_get(_HANDLE_CACHE, handle.lower())
+        if cached is not None:
+            return cached
             
         url = "https://www.googleapis.com/youtube/v3/channels"
         params = {
@@ -155,19 +322,19 @@ class YouTubeChatClient(BaseChatClient):
         }
         
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 401:
-                    raise AuthenticationError("Invalid YouTube API key")
-                elif response.status != 200:
-                    raise StreamChatError(f"Failed to resolve handle: {response.status}")
-                    
-                data = await response.json()
+            status, data = await self._get_json(url, params)
+            if status == 401:
+                raise AuthenticationError("Invalid YouTube API key")
+            elif status != 200:
+                raise StreamChatError(f"Failed to resolve handle: {status}")
                 
-                if not data.get('items'):
-                    raise StreamNotFoundError(f"Channel not found for handle: @{handle}")
-                    
-                return data['items'][0]['id']
+            if not data.get('items'):
+                raise StreamNotFoundError(f"Channel not found for handle: @{handle}")
                 
+            channel_id = data['items'][0]['id']
+            _cache_put(_HANDLE_CACHE, handle.lower(), channel_id, _HANDLE_TTL)
+            return channel_id
+            
         except Exception as e:
             raise StreamChatError(f"Error resolving handle to channel ID: {e}")
         
@@ -176,13 +343,14 @@ class YouTubeChatClient(BaseChatClient):
         if not self.api_key:
             raise AuthenticationError("YouTube API key is required")
             
-        self.session = aiohttp.ClientSession()
+        self._get_session()
         
-        # Get video ID
-        self.video_id = await self._get_video_id()
+        # Get video ID (channel lookups also resolve the live chat ID)
+        self.video_id, self.chat_id = await self._get_video_id()
 
         # Get live chat ID
-        self.chat_id = await self._get_live_chat_id()
+        if not self.chat_id:
+            self.chat_id = await self._get_live_chat_id()
         self.is_connected = True
         
     async def disconnect(self) -> None:
@@ -200,46 +368,67 @@ class YouTubeChatClient(BaseChatClient):
             'key': self.api_key
         }
         
-        async with self.session.get(url, params=params) as response:
-            if response.status == 401:
-                raise AuthenticationError("Invalid YouTube API key")
-            elif response.status != 200:
-                raise StreamChatError(f"Failed to get video info: {response.status}")
-                
-            data = await response.json()
+        status, data = await self._get_json(url, params)
+        if status == 401:
+            raise AuthenticationError("Invalid YouTube API key")
+        elif status != 200:
+            raise StreamChatError(f"Failed to get video info: {status}")
             
-            if not data.get('items'):
-                raise StreamNotFoundError(f"Video not found: {self.video_id}")
-                
-            item = data['items'][0]
-            live_details = item.get('liveStreamingDetails', {})
+        if not data.get('items'):
+            raise StreamNotFoundError(f"Video not found: {self.video_id}")
             
-            if 'activeLiveChatId' not in live_details:
-                raise StreamChatError("No active live chat found for this video")
-                
-            return live_details['activeLiveChatId']
+        item = data['items'][0]
+        live_details = item.get('liveStreamingDetails', {})
+        
+        if 'activeLiveChatId' not in live_details:
+            raise StreamChatError("No active live chat found for this video")
+            
+        return live_details['activeLiveChatId']
             
     async def listen(self) -> AsyncGenerator[ChatMessage, None]:
         """Listen for YouTube chat messages."""
         if not self.is_connected:
             raise StreamChatError("Not connected to chat stream")
         
+        # The first page replays recent chat history; drop what was sent
+        # before we started listening. Later pages only hold new messages,
+        # so they are yielded without comparing timestamps.
         now = datetime.now()
-
-        while self.is_connected:
-            try:
-                messages = await self._fetch_messages()
-                for message in messages:
-                    if message.timestamp > now:
-                        yield message
+        replay = True
+        
+        next_fetch = asyncio.create_task(self._fetch_messages())
+        try:
+            while self.is_connected:
+                try:
+                    messages = await next_fetch
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    raise StreamChatError(f"Error fetching messages: {e}") from e
                     
-                await asyncio.sleep(self.poll_interval)
+                # Schedule the next poll before yielding, so its wait and
+                # request overlap with the consumer handling this page
+                next_fetch = asyncio.create_task(self._fetch_messages_after(self.poll_interval))
                 
-            except Exception as e:
-                raise StreamChatError(f"Error fetching messages: {e}")
+                if replay:
+                    messages = (message for message in messages if message.timestamp > now)
+                    replay = False
+                    
+                for message in messages:
+                    yield message
+        finally:
+            next_fetch.cancel()
                 
-    async def _fetch_messages(self) -> list[ChatMessage]:
-        """Fetch new chat messages from YouTube API."""
+    async def _fetch_messages_after(self, delay: float) -> Iterator[ChatMessage]:
+        """Wait for the polling interval, then fetch new chat messages."""
+        await asyncio.sleep(delay)
+        return await self._fetch_messages()
+        
+    async def _fetch_messages(self) -> Iterator[ChatMessage]:
+        """
+        Fetch new chat messages from YouTube API.
+        
+        The page is downloaded and decoded up front, but items are only
+        parsed into ChatMessage objects as the returned iterator is consumed.
+        """
         url = "https://www.googleapis.com/youtube/v3/liveChat/messages"
         params = {
             'liveChatId': self.chat_id,
@@ -250,60 +439,108 @@ class YouTubeChatClient(BaseChatClient):
         if self.next_page_token:
             params['pageToken'] = self.next_page_token
             
+        # Ask only for what _parse_message reads, unless raw items are kept
+        if not self.keep_raw:
+            params['fields'] = _LIVE_CHAT_FIELDS
+            
         async with self.session.get(url, params=params) as response:
             if response.status != 200:
                 raise StreamChatError(f"Failed to fetch messages: {response.status}")
                 
-            data = await response.json()
+            body = await response.read()
             
-            self.next_page_token = data.get('nextPageToken')
-            self.poll_interval = data.get('pollingIntervalMillis', 2000) / 1000
+        # raw_data needs the plain dicts, so keep_raw always takes the JSON path
+        if _decode_live_chat_page is not None and not self.keep_raw:
+            try:
+                page = _decode_live_chat_page(body)
+            except _DECODE_ERRORS as e:
+                raise StreamChatError(f"Invalid messages response: {e}") from e
+            self.next_page_token = page.nextPageToken
+            self.poll_interval = page.pollingIntervalMillis / 1000
+            return (
+                message for message in map(self._parse_live_chat_item, page.items)
+                if message is not None
+            )
             
-            messages = []
-            for item in data.get('items', []):
-                message = self._parse_message(item)
-                if message:
-                    messages.append(message)
-                    
-            return messages
+        try:
+            data = _json_loads(body)
+        except ValueError as e:
+            raise StreamChatError(f"Invalid messages response: {e}") from e
+        
+        self.next_page_token = data.get('nextPageToken')
+        self.poll_interval = data.get('pollingIntervalMillis', 2000) / 1000
+        
+        return (
+            message for message in map(self._parse_message, data.get('items', ()))
+            if message is not None
+        )
             
     def _parse_message(self, item: Dict[str, Any]) -> Optional[ChatMessage]:
         """Parse a YouTube chat message."""
+        # Skip system messages before touching anything else
+        snippet = item.get('snippet')
+        if not snippet or snippet.get('type') != 'textMessageEvent':
+            return None
+            
         try:
-            snippet = item['snippet']
             author = item['authorDetails']
+            author_get = author.get
+            
+            # Read each author flag once; they also index the badge table
+            is_moderator = author_get('isChatModerator', False)
+            is_sponsor = author_get('isChatSponsor', False)
+            badges = _BADGE_TABLE[
+                bool(author_get('isChatOwner')) << 3
+                | bool(is_moderator) << 2
+                | bool(is_sponsor) << 1
+                | bool(author_get('isVerified'))
+            ]
             
-            # Skip system messages
-            if snippet.get('type') != 'textMessageEvent':
-                return None
-                
             return ChatMessage(
                 id=item['id'],
                 author=author['displayName'],
                 content=snippet['displayMessage'],
-                timestamp=datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')).astimezone().replace(tzinfo=None),
+                timestamp=_parse_published_at(snippet['publishedAt']),
                 platform='youtube',
                 author_id=author['channelId'],
-                badges=self._extract_badges(author),
-                is_moderator=author.get('isChatModerator', False),
-                is_subscriber=author.get('isChatSponsor', False),
-                raw_data=item
+                badges=badges,
+                is_moderator=is_moderator,
+                is_subscriber=is_sponsor,
+                raw_data=item if self.keep_raw else None
             )
         except KeyError as e:
             return None
             
-    def _extract_badges(self, author: Dict[str, Any]) -> list[str]:
-        """Extract user badges from author details."""
-        badges = []
-        if author.get('isChatOwner'):
-            badges.append('owner')
-        if author.get('isChatModerator'):
-            badges.append('moderator')
-        if author.get('isChatSponsor'):
-            badges.append('member')
-        if author.get('isVerified'):
-            badges.append('verified')
-        return badges
+    def _parse_live_chat_item(self, item: '_LiveChatItem') -> Optional[ChatMessage]:
+        """Parse a YouTube chat message decoded by msgspec."""
+        snippet = item.snippet
+        if snippet is None or snippet.type != 'textMessageEvent':
+            return None
+            
+        author = item.authorDetails
+        if (
+            author is None or item.id is None or author.displayName is None
+            or author.channelId is None or snippet.displayMessage is None
+            or snippet.publishedAt is None
+        ):
+            return None
+            
+        return ChatMessage(
+            id=item.id,
+            author=author.displayName,
+            content=snippet.displayMessage,
+            timestamp=_parse_published_at(snippet.publishedAt),
+            platform='youtube',
+            author_id=author.channelId,
+            badges=_BADGE_TABLE[
+                author.isChatOwner << 3
+                | author.isChatModerator << 2
+                | author.isChatSponsor << 1
+                | author.isVerified
+            ],
+            is_moderator=author.isChatModerator,
+            is_subscriber=author.isChatSponsor,
+        )
         
     def get_platform_name(self) -> str:
         """Return the platform name."""
@@ -4,10 +4,19 @@ Unified wrapper for all chat clients.
 
 import re
 from typing import AsyncGenerator, Optional, Dict, Any, Type
+from urllib.parse import urlsplit
 from .base import BaseChatClient, ChatMessage
 from .clients import YouTubeChatClient, TwitchChatClient, KickChatClient
 from .exceptions import PlatformNotSupportedError, StreamChatError
 
+# Hostname (or parent domain) -> platform
+_HOST_PLATFORMS: Dict[str, str] = {
+    'youtube.com': 'youtube',
+    'youtu.be': 'youtube',
+    'twitch.tv': 'twitch',
+    'kick.com': 'kick',
+}
+
 
 class StreamChatClient:
     """
@@ -34,6 +43,7 @@ class StreamChatClient:
                      - twitch_oauth_token: Twitch OAuth token
                      - twitch_username: Twitch username
                      - poll_interval: Polling interval for YouTube (seconds)
+                     - keep_raw: Keep raw API items on YouTube messages
         """
         self.stream_url = stream_url
         self.platform = self._detect_platform(stream_url)
@@ -42,6 +52,18 @@ class StreamChatClient:
         
     def _detect_platform(self, stream_url: str) -> str:
         """Detect the platform from the stream URL."""
+        # Look up the hostname, stripping subdomains (www., m., ...) one at a time
+        try:
+            host = urlsplit(stream_url if '://' in stream_url else '//' + stream_url).hostname or ''
+        except ValueError:
+            host = ''
+        while host:
+            platform = _HOST_PLATFORMS.get(host)
+            if platform:
+                return platform
+            host = host.partition('.')[2]
+            
+        # Fall back to substring checks for input that isn't a plain URL
         url_lower = stream_url.lower()
         
         # YouTube detection
@@ -99,6 +121,8 @@ class StreamChatClient:
                 config['api_key'] = self.config['youtube_api_key']
             if 'poll_interval' in self.config:
                 config['poll_interval'] = self.config['poll_interval']
+            if 'keep_raw' in self.config:
+                config['keep_raw'] = self.config['keep_raw']
                 
         elif self.platform == 'twitch':
             if 'twitch_oauth_token' in self.config: